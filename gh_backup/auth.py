@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
 import logging
-import re
 import subprocess
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum
 
 log = logging.getLogger(__name__)
 
+# Token cache keyed by hostname — `gh auth token` spawns a subprocess (~100ms),
+# so fetch it at most once per host per process.
+_token_cache: dict[str, str] = {}
+
 
 class AccountType(StrEnum):
     ORG = "org"
@@ -25,47 +31,84 @@ class AuthState:
     scopes: list[str] = field(default_factory=list)
 
 
-def check_auth() -> AuthState:
-    """Run `gh auth status` and return the current auth state.
+def _parse_status_lines(lines: Iterable[str]) -> tuple[str | None, str | None, list[str]]:
+    """Parse `gh auth status` lines, stopping once account and scopes are found.
 
-    Never raises — always returns an AuthState regardless of login status.
+    Returns (account, hostname, scopes); hostname is None if never seen.
     """
-    try:
-        result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        raise RuntimeError("GitHub CLI (gh) not found. Install it from https://cli.github.com/")
-
-    if result.returncode != 0:
-        return AuthState(logged_in=False, account=None, hostname="github.com", token=None)
-
-    # gh auth status writes to stderr
-    output = result.stderr or result.stdout
     account: str | None = None
-    hostname = "github.com"
+    hostname: str | None = None
     scopes: list[str] = []
 
-    for line in output.splitlines():
+    for line in lines:
         line = line.strip()
-        # "✓ Logged in to github.com account eoin-obrien (...)"
-        m = re.search(r"Logged in to (\S+) account (\S+)", line)
-        if m:
-            hostname = m.group(1)
-            account = m.group(2).rstrip("()")
+        lowered = line.lower()
+        if "Logged in to" in line:
+            # "✓ Logged in to github.com account eoin-obrien (...)"
+            parts = line.split()
+            try:
+                hostname = parts[parts.index("to") + 1]
+                account = parts[parts.index("account") + 1].rstrip("()")
+            except (ValueError, IndexError):
+                pass
         # "- Token scopes: 'repo', 'read:org', ..."  OR oauth_token legacy format
-        elif re.search(r"Token scopes:", line, re.IGNORECASE) or "oauth_token" in line.lower():
+        elif "scopes" in lowered or "oauth_token" in lowered:
             scopes_part = line.split(":", 1)[-1]
             scopes = [s.strip().strip("'\"") for s in scopes_part.split(",") if s.strip()]
+        if account and scopes:
+            break
 
-    token: str | None = None
-    try:
-        token = get_token()
-    except RuntimeError:
-        pass
+    return account, hostname, scopes
+
+
+def check_auth() -> AuthState:
+    """Run `gh auth status` and return the current auth state.
+
+    Never raises — always returns an AuthState regardless of login status.
+    Output is streamed line-by-line so parsing (and gh itself) can stop as
+    soon as the two relevant lines have been seen. The independent
+    `gh auth token` call runs on a worker thread, overlapping the two
+    subprocess startups.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Speculative: if we turn out not to be logged in, the fetch fails
+        # harmlessly and nothing is cached.
+        token_future = executor.submit(get_token)
+
+        try:
+            proc = subprocess.Popen(
+                ["gh", "auth", "status"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except FileNotFoundError:
+            raise RuntimeError("GitHub CLI (gh) not found. Install it from https://cli.github.com/")
+
+        # gh auth status writes to stderr; older versions used stdout.
+        account, hostname, scopes = _parse_status_lines(proc.stderr or ())
+        parsed_all = bool(account and scopes)
+        if parsed_all:
+            proc.terminate()
+        elif not account:
+            account, hostname, scopes = _parse_status_lines(proc.stdout or ())
+
+        returncode = proc.wait()
+        if not account and returncode != 0:
+            return AuthState(logged_in=False, account=None, hostname="github.com", token=None)
+
+        hostname = hostname or "github.com"
+
+        # The speculative fetch targeted the default host, so its result is
+        # only valid when that's the host gh reported; on a GHE hostname it
+        # is discarded (get_token already cached it under "github.com"), and
+        # callers fall back to get_token(state.hostname) for the right one.
+        token: str | None = None
+        if hostname == "github.com":
+            try:
+                token = token_future.result()
+            except RuntimeError:
+                pass
 
     return AuthState(
         logged_in=True,
@@ -93,64 +136,81 @@ def require_auth() -> AuthState:
     return state
 
 
-def get_token() -> str:
-    """Return the current GitHub auth token via `gh auth token`."""
+def get_token(hostname: str = "github.com") -> str:
+    """Return the current GitHub auth token via `gh auth token`.
+
+    The result is cached per hostname for the lifetime of the process.
+    """
+    cached = _token_cache.get(hostname)
+    if cached is not None:
+        return cached
     try:
         result = subprocess.run(
-            ["gh", "auth", "token"],
+            ["gh", "auth", "token", "--hostname", hostname],
             capture_output=True,
             text=True,
             check=True,
         )
-        return result.stdout.strip()
+        token = result.stdout.strip()
+        _token_cache[hostname] = token
+        return token
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to get GitHub token: {e.stderr.strip()}") from e
     except FileNotFoundError:
         raise RuntimeError("GitHub CLI (gh) not found.")
 
 
+# Scopes the tool relies on, mapped to their warning messages.
+_SCOPE_WARNINGS = {
+    "repo": (
+        "Token is missing the [bold]repo[/] scope — private repository clones will fail. "
+        "Run [bold cyan]gh auth refresh -s repo[/] to add it."
+    ),
+    "read:org": (
+        "Token is missing the [bold]read:org[/] scope — organization repository listing "
+        "may fail. Run [bold cyan]gh auth refresh -s read:org[/] to add it."
+    ),
+}
+
+
 def warn_missing_scopes(state: AuthState) -> list[str]:
     """Return a list of warning messages for likely missing token scopes.
 
     Only warns when scopes are non-empty (i.e. we successfully parsed them),
     to avoid false positives with fine-grained tokens or parsing failures.
     """
-    warnings: list[str] = []
     if not state.scopes:
-        return warnings
-    if "repo" not in state.scopes:
-        warnings.append(
-            "Token is missing the [bold]repo[/] scope — private repository clones will fail. "
-            "Run [bold cyan]gh auth refresh -s repo[/] to add it."
-        )
-    if "read:org" not in state.scopes:
-        warnings.append(
-            "Token is missing the [bold]read:org[/] scope — organization repository listing "
-            "may fail. Run [bold cyan]gh auth refresh -s read:org[/] to add it."
-        )
-    return warnings
+        return []
+    missing = _SCOPE_WARNINGS.keys() - frozenset(state.scopes)
+    return [message for scope, message in _SCOPE_WARNINGS.items() if scope in missing]
 
 
 def resolve_account_type(name: str) -> AccountType:
-    """Detect whether `name` is a GitHub org or user by probing the API.
+    """Detect whether `name` is a GitHub org or user with a single GraphQL call.
 
-    Tries /orgs/{name} first; falls back to /users/{name}.
-    Raises RuntimeError if neither endpoint succeeds.
+    `repositoryOwner` covers both account types, so one round trip replaces
+    the old serial /orgs then /users REST probing.
+    Raises RuntimeError if the name resolves to neither.
     """
-    for account_type, endpoint in [
-        (AccountType.ORG, f"/orgs/{name}"),
-        (AccountType.USER, f"/users/{name}"),
-    ]:
-        try:
-            subprocess.run(
-                ["gh", "api", endpoint],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return account_type
-        except subprocess.CalledProcessError:
-            continue
+    query = "query($login:String!){repositoryOwner(login:$login){__typename}}"
+    try:
+        result = subprocess.run(
+            # -f passes the login as a raw string; -F would coerce an
+            # all-numeric account name into a JSON number, which the server
+            # rejects against $login: String!.
+            ["gh", "api", "graphql", "-f", f"query={query}", "-f", f"login={name}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        owner = json.loads(result.stdout).get("data", {}).get("repositoryOwner") or {}
+        typename = owner.get("__typename")
+        if typename == "Organization":
+            return AccountType.ORG
+        if typename == "User":
+            return AccountType.USER
+    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        pass
     raise RuntimeError(
         f"'{name}' not found as an org or user. Check the name and your permissions."
     )
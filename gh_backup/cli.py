@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.table import Table
 
 from . import __version__
 from .compress import ArchiveFormat
-from .exporter import ExportConfig, Visibility, run_export
+from .exporter import CloneType, ExportConfig, Visibility, run_export
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 APP_NAME = "gh-backup"
 
@@ -28,10 +28,20 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+
+@functools.cache
+def _console() -> Console:
+    """Build the shared stdout console on first use — Console() probes the
+    terminal (isatty, env vars, color support) and isn't free at import time."""
+    from rich.console import Console
+
+    return Console()
 
 
 def _setup_logging(verbose: bool) -> None:
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(
         level=level,
@@ -48,7 +58,7 @@ def main(
     ] = False,
 ) -> None:
     if version:
-        console.print(f"{APP_NAME} [bold]{__version__}[/]")
+        _console().print(f"{APP_NAME} [bold]{__version__}[/]")
         raise typer.Exit()
 
 
@@ -58,8 +68,11 @@ def auth_command(
 ) -> None:
     """Check GitHub CLI authentication status."""
     _setup_logging(verbose)
+    from rich.panel import Panel
+
     from . import auth
 
+    console = _console()
     try:
         state = auth.check_auth()
     except RuntimeError as e:
@@ -97,15 +110,15 @@ def export_command(
         typer.Option("--output", "-o", help="Directory to write exports into."),
     ],
     workers: Annotated[
-        int,
+        int | None,
         typer.Option(
             "--workers",
             "-w",
-            help="Number of parallel repo clone workers.",
+            help="Number of parallel repo clone workers (default: 3/4 of CPU cores).",
             min=1,
             max=32,
         ),
-    ] = 4,
+    ] = None,
     no_compress: Annotated[
         bool,
         typer.Option("--no-compress", help="Skip compression; keep the raw export directory."),
@@ -133,6 +146,22 @@ def export_command(
         bool,
         typer.Option("--shallow", help="Shallow clone (--depth 1); faster but no full history."),
     ] = False,
+    clone_type: Annotated[
+        CloneType,
+        typer.Option(
+            "--clone-type",
+            help="How much to clone: full history, shallow snapshot, or a "
+            "blobless/treeless partial clone.",
+            show_default=True,
+        ),
+    ] = CloneType.FULL,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            help="Keep persistent per-org mirrors here so repeat backups only fetch new objects.",
+        ),
+    ] = None,
     skip_issues: Annotated[
         bool,
         typer.Option("--skip-issues", help="Skip issues and pull request export."),
@@ -178,10 +207,13 @@ def export_command(
     _setup_logging(verbose)
     from . import auth
 
+    console = _console()
     console.print(f"[bold]{APP_NAME}[/] [dim]v{__version__}[/]\n")
     try:
         auth_state = auth.require_auth()
-        token = auth.get_token()
+        # check_auth() already fetched the token; only fall back to a fresh
+        # `gh auth token` call if it could not be resolved.
+        token = auth_state.token or auth.get_token(auth_state.hostname)
     except RuntimeError as e:
         console.print(f"[bold red]Error:[/] {e}")
         raise typer.Exit(1)
@@ -191,6 +223,10 @@ def export_command(
 
     console.print(f"Authenticated as [bold green]{auth_state.account}[/] on {auth_state.hostname}")
 
+    # --shallow remains as shorthand for --clone-type shallow.
+    if shallow and clone_type is CloneType.FULL:
+        clone_type = CloneType.SHALLOW
+
     console.print(f"Resolving [bold cyan]{org}[/]...")
     try:
         account_type = auth.resolve_account_type(org)
@@ -214,11 +250,12 @@ def export_command(
         keep_dir=keep_dir,
         git_gc=git_gc,
         dry_run=dry_run,
-        shallow=shallow,
+        clone_type=clone_type,
         verify=verify,
+        cache_dir=cache_dir.resolve() / org if cache_dir else None,
     )
 
-    if shallow and git_gc:
+    if clone_type is CloneType.SHALLOW and git_gc:
         console.print(
             "[bold yellow]Warning:[/] --shallow and --gc are both set. "
             "git gc --aggressive has no effect on shallow clones."
@@ -244,6 +281,8 @@ def export_command(
 
 
 def _print_summary(stats, console: Console) -> None:
+    from rich.table import Table
+
     table = Table(
         title="Export Summary",
         show_header=True,
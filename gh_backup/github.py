@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import subprocess
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 log = logging.getLogger(__name__)
 
+# Shared by _parse_paginated_json's fallback scan: one decoder for all calls,
+# and a regex whitespace skip instead of per-character Python bytecode.
+_DECODER = json.JSONDecoder()
+_WS_RE = re.compile(r"\s*")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RepoInfo:
     name: str
     url: str
@@ -36,11 +43,15 @@ class ExportStats:
 
 
 def _run_gh(*args: str, **kwargs) -> subprocess.CompletedProcess:
-    """Run `gh` with the given args. Raises CalledProcessError on failure."""
+    """Run `gh` with the given args. Raises CalledProcessError on failure.
+
+    stdout is left as bytes: every caller feeds it to json.loads, which
+    parses UTF-8 bytes directly, so decoding to str first would be a
+    second pass over the payload for nothing.
+    """
     return subprocess.run(
         ["gh", *args],
         capture_output=True,
-        text=True,
         check=True,
         **kwargs,
     )
@@ -63,25 +74,27 @@ def list_repos(org: str, only: list[str] | None = None) -> list[RepoInfo]:
     )
     raw: list[dict] = json.loads(result.stdout)
 
+    # Filter on the raw name before constructing RepoInfo, so a narrow
+    # `only` list skips the dataclass build for every excluded repo.
+    only_set = frozenset(only) if only else None
+    # Positional construction in RepoInfo field order — skips the kwarg
+    # dict built for each keyword call on orgs with thousands of repos.
     repos = [
         RepoInfo(
-            name=r["name"],
-            url=r["url"],
-            ssh_url=r.get("sshUrl", ""),
-            is_private=r.get("isPrivate", False),
-            is_fork=r.get("isFork", False),
-            is_archived=r.get("isArchived", False),
-            description=r.get("description") or "",
-            default_branch=(r.get("defaultBranchRef") or {}).get("name"),
-            disk_usage_kb=r.get("diskUsage") or 0,
+            r["name"],  # name
+            r["url"],  # url
+            r.get("sshUrl", ""),  # ssh_url
+            r.get("isPrivate", False),  # is_private
+            r.get("isFork", False),  # is_fork
+            r.get("isArchived", False),  # is_archived
+            r.get("description") or "",  # description
+            (r.get("defaultBranchRef") or {}).get("name"),  # default_branch
+            r.get("diskUsage") or 0,  # disk_usage_kb
         )
         for r in raw
+        if only_set is None or r["name"] in only_set
     ]
 
-    if only:
-        only_set = set(only)
-        repos = [r for r in repos if r.name in only_set]
-
     log.debug("Found %d repos", len(repos))
     return repos
 
@@ -121,32 +134,189 @@ def fetch_pulls(org: str, repo: str) -> list[dict]:
     return _parse_paginated_json(result.stdout)
 
 
-def _parse_paginated_json(output: str) -> list[dict]:
+# One page of issues and PRs in a single request. @include lets the pagination
+# loop drop whichever connection is already exhausted on later pages.
+#
+# The field set mirrors what the REST endpoints export (author, assignees,
+# milestone, labels, comment/reaction counts, merge metadata), though keys
+# follow GraphQL's camelCase schema rather than REST's snake_case — the two
+# paths produce equivalent but not byte-identical documents. Caps: GitHub
+# allows at most 10 assignees, and labels carry pageInfo so the pagination
+# loop can detect the >100 case and fall back to REST instead of silently
+# truncating (see _raise_on_label_overflow).
+_LABEL_CAP = 100
+
+_ISSUES_PULLS_QUERY = """\
+query(
+  $owner: String!, $name: String!,
+  $issuesCursor: String, $pullsCursor: String,
+  $fetchIssues: Boolean!, $fetchPulls: Boolean!
+) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $issuesCursor, states: [OPEN, CLOSED]) @include(if: $fetchIssues) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state stateReason locked body url
+        createdAt updatedAt closedAt
+        author { login }
+        assignees(first: 10) { nodes { login } }
+        milestone { number title state dueOn }
+        labels(first: 100) { pageInfo { hasNextPage } nodes { name color description } }
+        comments { totalCount }
+        reactions { totalCount }
+      }
+    }
+    pullRequests(first: 100, after: $pullsCursor, states: [OPEN, CLOSED, MERGED]) \
+@include(if: $fetchPulls) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state locked isDraft body url
+        createdAt updatedAt closedAt mergedAt merged
+        baseRefName headRefName additions deletions changedFiles
+        author { login }
+        mergedBy { login }
+        assignees(first: 10) { nodes { login } }
+        milestone { number title state dueOn }
+        labels(first: 100) { pageInfo { hasNextPage } nodes { name color description } }
+        comments { totalCount }
+        reactions { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+def _raise_on_label_overflow(nodes: list[dict], org: str, repo: str) -> None:
+    """Refuse to truncate: a node with more labels than the query cap makes the
+    whole repo fall back to REST, which has no per-item label limit."""
+    for node in nodes:
+        labels = node.get("labels") or {}
+        if (labels.get("pageInfo") or {}).get("hasNextPage"):
+            raise RuntimeError(
+                f"{org}/{repo}#{node.get('number')} has more than {_LABEL_CAP} labels; "
+                "use the REST fallback for full fidelity"
+            )
+
+
+def iter_issues_and_pulls_graphql(org: str, repo: str) -> Iterator[tuple[list[dict], list[dict]]]:
+    """Yield (issues, pulls) node lists page by page, one GraphQL request each.
+
+    Both connections ride the same HTTP request per page (first: 100), so this
+    halves round trips versus the two paginated REST endpoints, and yielding
+    per page lets callers stream to disk with only ~100 items resident.
+    Nodes use GraphQL's camelCase schema (see _ISSUES_PULLS_QUERY for the
+    fidelity notes). Raises RuntimeError on GraphQL errors or a label-cap
+    overflow so callers can fall back to REST.
+    """
+    log.debug("Fetching issues+pulls via GraphQL for %s/%s", org, repo)
+    issues_cursor: str | None = None
+    pulls_cursor: str | None = None
+    more_issues = True
+    more_pulls = True
+
+    while more_issues or more_pulls:
+        # String variables go through -f (raw): -F's typed coercion would turn
+        # an all-numeric owner or repo name (repos named "2048" exist) into a
+        # JSON number and fail the query. Only the booleans want -F.
+        args = [
+            "api",
+            "graphql",
+            "-f",
+            f"query={_ISSUES_PULLS_QUERY}",
+            "-f",
+            f"owner={org}",
+            "-f",
+            f"name={repo}",
+            "-F",
+            f"fetchIssues={'true' if more_issues else 'false'}",
+            "-F",
+            f"fetchPulls={'true' if more_pulls else 'false'}",
+        ]
+        if issues_cursor:
+            args += ["-f", f"issuesCursor={issues_cursor}"]
+        if pulls_cursor:
+            args += ["-f", f"pullsCursor={pulls_cursor}"]
+
+        payload = json.loads(_run_gh(*args).stdout)
+        if payload.get("errors"):
+            raise RuntimeError(f"GraphQL errors for {org}/{repo}: {payload['errors']}")
+        repository = (payload.get("data") or {}).get("repository")
+        if repository is None:
+            raise RuntimeError(f"GraphQL returned no repository for {org}/{repo}")
+
+        issues_nodes: list[dict] = []
+        pulls_nodes: list[dict] = []
+        page = repository.get("issues")
+        if page is not None:
+            issues_nodes = page["nodes"]
+            more_issues = page["pageInfo"]["hasNextPage"]
+            issues_cursor = page["pageInfo"]["endCursor"]
+        page = repository.get("pullRequests")
+        if page is not None:
+            pulls_nodes = page["nodes"]
+            more_pulls = page["pageInfo"]["hasNextPage"]
+            pulls_cursor = page["pageInfo"]["endCursor"]
+        _raise_on_label_overflow(issues_nodes, org, repo)
+        _raise_on_label_overflow(pulls_nodes, org, repo)
+        yield issues_nodes, pulls_nodes
+
+
+def fetch_issues_and_pulls_graphql(org: str, repo: str) -> tuple[list[dict], list[dict]]:
+    """Fetch all issues and PRs for a repo as full lists (see the iter variant)."""
+    issues: list[dict] = []
+    pulls: list[dict] = []
+    for issues_page, pulls_page in iter_issues_and_pulls_graphql(org, repo):
+        issues.extend(issues_page)
+        pulls.extend(pulls_page)
+    return issues, pulls
+
+
+def _parse_paginated_json(output: str | bytes) -> list[dict]:
     """Parse paginated gh output, which may be concatenated JSON arrays."""
     output = output.strip()
     if not output:
         return []
 
     # gh --paginate concatenates arrays: [...][...] → parse each separately
-    # and merge, or if it's already valid JSON, parse directly.
+    # and merge, or if it's already valid JSON, parse directly. json.loads
+    # handles UTF-8 bytes natively, so the common single-document case
+    # never pays for a str decode.
     try:
         parsed = json.loads(output)
         if isinstance(parsed, list):
             return parsed
         return [parsed]
     except json.JSONDecodeError:
+        if isinstance(output, bytes):
+            # The seam-split and scan fallbacks below work on text.
+            output = output.decode("utf-8")
+        # Fast path: gh joins pages as "]\n[" (or "]["), so splitting on the
+        # seam and parsing each array with the C-accelerated json.loads is
+        # much cheaper than the pure-Python raw_decode scan below. JSON
+        # strings can't contain a raw newline, so "]\n[" never appears
+        # inside a value.
+        if output.startswith("[") and output.endswith("]") and "]\n[" in output:
+            try:
+                items = []
+                for chunk in output.split("]\n["):
+                    if not chunk.startswith("["):
+                        chunk = "[" + chunk
+                    if not chunk.endswith("]"):
+                        chunk += "]"
+                    items.extend(json.loads(chunk))
+                return items
+            except json.JSONDecodeError:
+                pass  # fall through to the tolerant scan
         # Try to handle concatenated arrays: "[...]\n[...]"
         items: list[dict] = []
-        decoder = json.JSONDecoder()
         pos = 0
         while pos < len(output):
-            # Skip whitespace
-            while pos < len(output) and output[pos].isspace():
-                pos += 1
+            pos = _WS_RE.match(output, pos).end()
             if pos >= len(output):
                 break
             try:
-                obj, end_pos = decoder.raw_decode(output, pos)
+                obj, end_pos = _DECODER.raw_decode(output, pos)
                 if isinstance(obj, list):
                     items.extend(obj)
                 else:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import io
 import json
 import subprocess
 
 import pytest
 
+from gh_backup import auth
 from gh_backup.auth import AccountType, AuthState
 from gh_backup.compress import ArchiveFormat
 from gh_backup.exporter import ExportConfig
@@ -27,6 +29,44 @@ def make_completed_process(
     return result
 
 
+class FakePopen:
+    """Minimal subprocess.Popen stand-in with line-iterable stdout/stderr."""
+
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0):
+        self.stdout = io.StringIO(stdout)
+        self.stderr = io.StringIO(stderr)
+        self.returncode = returncode
+        self.terminated = False
+
+    def wait(self, timeout: float | None = None) -> int:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+# ── cache isolation ───────────────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Keep the per-process token cache from leaking between tests."""
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch):
+    """Zero out the retry backoff so retry-exercising tests never sleep.
+
+    Any test that drives tenacity through its failure path would otherwise
+    wait out wait_exponential (seconds per attempt) — or silently do so
+    when a new test forgets the per-test patch.
+    """
+    monkeypatch.setattr("gh_backup.exporter._sleep_or_cancel", lambda stop_event, seconds: None)
+
+
 # ── raw test data strings ─────────────────────────────────────────────────────
 
 GH_AUTH_STATUS_LOGGED_IN = """\
@@ -67,26 +107,32 @@ REPO_LIST_JSON = json.dumps(
 # ── auth fixtures ─────────────────────────────────────────────────────────────
 
 
+# AuthState is frozen and no test mutates the scopes list, so the fixtures
+# can hand every test the same instances instead of rebuilding them.
+LOGGED_IN_STATE = AuthState(
+    logged_in=True,
+    account="testuser",
+    hostname="github.com",
+    token="ghs_testtoken",
+    scopes=["repo", "read:org"],
+)
+LOGGED_OUT_STATE = AuthState(
+    logged_in=False,
+    account=None,
+    hostname="github.com",
+    token=None,
+    scopes=[],
+)
+
+
 @pytest.fixture
 def auth_state_logged_in() -> AuthState:
-    return AuthState(
-        logged_in=True,
-        account="testuser",
-        hostname="github.com",
-        token="ghs_testtoken",
-        scopes=["repo", "read:org"],
-    )
+    return LOGGED_IN_STATE
 
 
 @pytest.fixture
 def auth_state_logged_out() -> AuthState:
-    return AuthState(
-        logged_in=False,
-        account=None,
-        hostname="github.com",
-        token=None,
-        scopes=[],
-    )
+    return LOGGED_OUT_STATE
 
 
 # ── repo fixtures ─────────────────────────────────────────────────────────────
@@ -158,11 +204,57 @@ def export_config(tmp_path) -> ExportConfig:
 
 
 @pytest.fixture
-def source_dir(tmp_path):
-    """A small directory tree suitable for compression tests."""
-    src = tmp_path / "source"
+def repos_dir(tmp_path):
+    """A ready-made `repos/` directory, as create_export_dir would lay it out."""
+    d = tmp_path / "repos"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    """A ready-made `issues/` directory, as create_export_dir would lay it out."""
+    d = tmp_path / "issues"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture(scope="session")
+def source_dir(tmp_path_factory):
+    """A small directory tree suitable for compression tests.
+
+    Session-scoped: every consumer only reads from it, so building the
+    tree once avoids per-test mkdir/write syscalls.
+    """
+    src = tmp_path_factory.mktemp("compress-src") / "source"
     (src / "sub").mkdir(parents=True)
     (src / "file1.txt").write_text("hello")
     (src / "sub" / "file2.txt").write_text("world")
     (src / "empty_dir").mkdir()
     return src
+
+
+@pytest.fixture(scope="session")
+def prebuilt_archives(tmp_path_factory, source_dir):
+    """Archives compressed once per session, keyed by (format, level).
+
+    Tests that only need "a valid archive of this format/level" read from
+    here instead of re-running the CPU-bound compression per test.
+    """
+    from gh_backup.compress import compress_directory, get_archive_suffix
+
+    src = source_dir
+    out_dir = tmp_path_factory.mktemp("archives")
+    archives: dict[tuple[ArchiveFormat, int], object] = {}
+    for fmt, level in [
+        (ArchiveFormat.ZST, 1),
+        (ArchiveFormat.ZST, 3),
+        (ArchiveFormat.ZST, 9),
+        (ArchiveFormat.GZ, 3),
+        (ArchiveFormat.XZ, 3),
+    ]:
+        output = out_dir / f"out-{fmt}-{level}{get_archive_suffix(fmt)}"
+        archives[(fmt, level)] = compress_directory(
+            source_dir=src, output_path=output, fmt=fmt, level=level
+        )
+    return archives
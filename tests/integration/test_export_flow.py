@@ -9,6 +9,8 @@ from __future__ import annotations
 import json
 from io import StringIO
 from pathlib import Path
+from typing import NamedTuple
+from unittest import mock
 
 import pytest
 from rich.console import Console
@@ -16,6 +18,7 @@ from rich.console import Console
 from gh_backup.auth import AccountType
 from gh_backup.compress import ArchiveFormat
 from gh_backup.exporter import ExportConfig, run_export
+from gh_backup.github import ExportStats
 from tests.conftest import REPO_LIST_JSON, make_completed_process
 
 
@@ -25,28 +28,65 @@ def _console() -> Console:
 
 ISSUES_JSON = json.dumps([{"id": 1, "title": "Bug"}])
 PULLS_JSON = json.dumps([{"id": 10, "title": "Feature PR"}])
+GRAPHQL_JSON = json.dumps(
+    {
+        "data": {
+            "repository": {
+                "issues": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [{"number": 1, "title": "Bug"}],
+                },
+                "pullRequests": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [{"number": 10, "title": "Feature PR"}],
+                },
+            }
+        }
+    }
+)
+
+
+# Clone destinations already created by the mock — skips the repeat mkdir
+# syscall when retries or shared fixtures replay the same clone.
+_created_clone_dirs: set[Path] = set()
+
+# Every payload is known at import time, so build each CompletedProcess once
+# and hand the same instance back — callers only read from them.
+_CP_REPO_LIST = make_completed_process(stdout=REPO_LIST_JSON)
+_CP_GRAPHQL = make_completed_process(stdout=GRAPHQL_JSON)
+_CP_ISSUES = make_completed_process(stdout=ISSUES_JSON)
+_CP_PULLS = make_completed_process(stdout=PULLS_JSON)
+_CP_OK = make_completed_process()
+
+
+def _subprocess_side_effect(cmd, **kwargs):
+    """Dispatch mocked subprocess calls on argv structure, not a joined string."""
+    prog = cmd[0]
+    if prog == "gh":
+        if cmd[1] == "repo" and cmd[2] == "list":
+            return _CP_REPO_LIST
+        if cmd[1] == "api":
+            target = cmd[2]
+            if target == "graphql":
+                return _CP_GRAPHQL
+            if target.endswith("/issues"):
+                return _CP_ISSUES
+            if target.endswith("/pulls"):
+                return _CP_PULLS
+    elif prog == "git" and "clone" in cmd:
+        # Simulate a successful clone by creating the destination directory
+        dest = Path(cmd[-1])
+        if dest not in _created_clone_dirs:
+            dest.mkdir(parents=True, exist_ok=True)
+            _created_clone_dirs.add(dest)
+        return _CP_OK
+    return _CP_OK
 
 
 @pytest.fixture
 def full_mock_subprocess(mocker):
     """Mock subprocess.run globally, dispatching on command content."""
-
-    def side_effect(cmd, **kwargs):
-        cmd_str = " ".join(str(c) for c in cmd)
-        if "repo list" in cmd_str:
-            return make_completed_process(stdout=REPO_LIST_JSON)
-        if "git clone" in cmd_str:
-            # Simulate a successful clone by creating the destination directory
-            dest = Path(cmd[-1])
-            dest.mkdir(parents=True, exist_ok=True)
-            return make_completed_process()
-        if "/issues" in cmd_str:
-            return make_completed_process(stdout=ISSUES_JSON)
-        if "/pulls" in cmd_str:
-            return make_completed_process(stdout=PULLS_JSON)
-        return make_completed_process()
-
-    mocker.patch("subprocess.run", side_effect=side_effect)
+    mocker.patch("subprocess.run", side_effect=_subprocess_side_effect)
 
 
 def _make_config(tmp_path, **overrides) -> ExportConfig:
@@ -66,25 +106,39 @@ def _make_config(tmp_path, **overrides) -> ExportConfig:
     return ExportConfig(**defaults)
 
 
+class Exported(NamedTuple):
+    stats: ExportStats
+    export_dir: Path
+
+
+@pytest.fixture(scope="class")
+def exported(tmp_path_factory) -> Exported:
+    """Run the default happy-path export once per class and share the result.
+
+    The pipeline is the expensive part; each test then asserts one property
+    on the shared stats/artifacts. Tests that vary the config keep the
+    function-scoped full_mock_subprocess fixture and run their own export.
+    """
+    tmp_path = tmp_path_factory.mktemp("export-flow")
+    with mock.patch("subprocess.run", side_effect=_subprocess_side_effect):
+        stats = run_export(_make_config(tmp_path), _console())
+    export_dir = next((tmp_path / "output").iterdir())
+    return Exported(stats, export_dir)
+
+
 class TestFullExportFlow:
-    def test_happy_path_two_repos(self, full_mock_subprocess, tmp_path):
+    def test_happy_path_two_repos(self, exported):
         """2 repos cloned, issues exported, no compression."""
-        stats = run_export(_make_config(tmp_path), _console())
-        assert stats.repos_total == 2
-        assert stats.repos_cloned == 2
-        assert stats.repos_failed == 0
-
-    def test_creates_metadata_json_with_correct_org(self, full_mock_subprocess, tmp_path):
-        run_export(_make_config(tmp_path), _console())
-        output_dirs = list((tmp_path / "output").iterdir())
-        assert len(output_dirs) == 1
-        data = json.loads((output_dirs[0] / "metadata.json").read_text())
+        assert exported.stats.repos_total == 2
+        assert exported.stats.repos_cloned == 2
+        assert exported.stats.repos_failed == 0
+
+    def test_creates_metadata_json_with_correct_org(self, exported):
+        data = json.loads((exported.export_dir / "metadata.json").read_text())
         assert data["org"] == "myorg"
 
-    def test_creates_issues_json_files(self, full_mock_subprocess, tmp_path):
-        run_export(_make_config(tmp_path), _console())
-        export_dir = next((tmp_path / "output").iterdir())
-        issues_files = list((export_dir / "issues").rglob("issues.json"))
+    def test_creates_issues_json_files(self, exported):
+        issues_files = list((exported.export_dir / "issues").rglob("issues.json.zst"))
         assert len(issues_files) > 0
 
     def test_only_repos_filter_restricts_count(self, full_mock_subprocess, tmp_path):
@@ -97,13 +151,11 @@ class TestFullExportFlow:
         assert stats.issues_exported == 0
         assert stats.pulls_exported == 0
 
-    def test_export_dir_structure_is_correct(self, full_mock_subprocess, tmp_path):
+    def test_export_dir_structure_is_correct(self, exported):
         """Export directory contains repos/ and issues/ subdirectories."""
-        run_export(_make_config(tmp_path), _console())
-        export_dir = next((tmp_path / "output").iterdir())
-        assert (export_dir / "repos").is_dir()
-        assert (export_dir / "issues").is_dir()
-        assert (export_dir / "metadata.json").exists()
+        assert (exported.export_dir / "repos").is_dir()
+        assert (exported.export_dir / "issues").is_dir()
+        assert (exported.export_dir / "metadata.json").exists()
 
     @pytest.mark.parametrize("fmt", ["zst", "gz", "xz"])
     def test_compress_produces_valid_archive(self, full_mock_subprocess, tmp_path, fmt):
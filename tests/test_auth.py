@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 
 import pytest
 import typer
 
+from gh_backup import auth
 from gh_backup.auth import (
     AccountType,
     AuthState,
@@ -16,21 +18,25 @@ from gh_backup.auth import (
     resolve_account_type,
     warn_missing_scopes,
 )
-from tests.conftest import GH_AUTH_STATUS_LOGGED_IN, make_completed_process
+from tests.conftest import GH_AUTH_STATUS_LOGGED_IN, FakePopen, make_completed_process
 
 # ── check_auth ────────────────────────────────────────────────────────────────
 
 
 class TestCheckAuth:
+    def _mock_token(self, mocker, token: str = "ghs_testtoken") -> None:
+        mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            return_value=make_completed_process(stdout=f"{token}\n"),
+        )
+
     def test_returns_logged_in_state_when_authenticated(self, mocker):
         """Happy path: gh auth status succeeds, account/hostname/scopes/token parsed."""
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stderr=GH_AUTH_STATUS_LOGGED_IN, returncode=0),
-                make_completed_process(stdout="ghs_testtoken\n", returncode=0),
-            ],
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stderr=GH_AUTH_STATUS_LOGGED_IN),
         )
+        self._mock_token(mocker)
         state = check_auth()
         assert state.logged_in is True
         assert state.account == "testuser"
@@ -40,9 +46,14 @@ class TestCheckAuth:
 
     def test_returns_not_logged_in_on_nonzero_returncode(self, mocker):
         """Non-zero returncode → AuthState(logged_in=False), never raises."""
+        mocker.patch(
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(returncode=1),
+        )
+        # The speculative token fetch fails alongside the status check
         mocker.patch(
             "gh_backup.auth.subprocess.run",
-            return_value=make_completed_process(returncode=1),
+            side_effect=subprocess.CalledProcessError(1, "gh", stderr="not logged in"),
         )
         state = check_auth()
         assert state.logged_in is False
@@ -52,20 +63,22 @@ class TestCheckAuth:
     def test_raises_runtime_error_when_gh_not_found(self, mocker):
         """FileNotFoundError from subprocess → RuntimeError with install hint."""
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
+            "gh_backup.auth.subprocess.Popen",
             side_effect=FileNotFoundError,
         )
+        mocker.patch("gh_backup.auth.subprocess.run", side_effect=FileNotFoundError)
         with pytest.raises(RuntimeError, match="not found"):
             check_auth()
 
     def test_token_none_when_get_token_fails(self, mocker):
         """Token fetch RuntimeError is caught — returns None token, still logged_in=True."""
+        mocker.patch(
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stderr=GH_AUTH_STATUS_LOGGED_IN),
+        )
         mocker.patch(
             "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stderr=GH_AUTH_STATUS_LOGGED_IN, returncode=0),
-                subprocess.CalledProcessError(1, "gh", stderr="no token"),
-            ],
+            side_effect=subprocess.CalledProcessError(1, "gh", stderr="no token"),
         )
         state = check_auth()
         assert state.logged_in is True
@@ -91,38 +104,47 @@ class TestCheckAuth:
         self, mocker, stderr, expected_hostname, expected_account
     ):
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stderr=stderr, returncode=0),
-                make_completed_process(stdout="tok\n", returncode=0),
-            ],
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stderr=stderr),
         )
+        self._mock_token(mocker, "tok")
         state = check_auth()
         assert state.hostname == expected_hostname
         assert state.account == expected_account
 
+    def test_speculative_token_not_cached_under_enterprise_hostname(self, mocker):
+        """The eager fetch targets the default host — attaching its result to a
+        GHE hostname would poison get_token for the rest of the process."""
+        mocker.patch(
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(
+                stderr="  Logged in to github.enterprise.com account corp-user (keyring)\n"
+                "  Token scopes: 'repo'\n"
+            ),
+        )
+        self._mock_token(mocker, "github-com-token")
+        state = check_auth()
+        assert state.token is None
+        assert "github.enterprise.com" not in auth._token_cache
+
     def test_scopes_parsed_and_stripped(self, mocker):
         """Scopes are split on commas and surrounding quotes removed."""
         stderr = "  Logged in to github.com account u (k)\n  Token scopes: 'repo', 'read:org'\n"
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stderr=stderr, returncode=0),
-                make_completed_process(stdout="tok\n", returncode=0),
-            ],
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stderr=stderr),
         )
+        self._mock_token(mocker, "tok")
         state = check_auth()
         assert state.scopes == ["repo", "read:org"]
 
     def test_falls_back_to_stdout_when_stderr_empty(self, mocker):
-        """Uses stdout output when stderr is falsy (code does `stderr or stdout`)."""
+        """Uses stdout output when stderr yields nothing (older gh versions)."""
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stdout=GH_AUTH_STATUS_LOGGED_IN, stderr="", returncode=0),
-                make_completed_process(stdout="tok\n", returncode=0),
-            ],
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stdout=GH_AUTH_STATUS_LOGGED_IN, stderr=""),
         )
+        self._mock_token(mocker, "tok")
         state = check_auth()
         assert state.logged_in is True
         assert state.account == "testuser"
@@ -130,16 +152,22 @@ class TestCheckAuth:
     def test_malformed_output_returns_valid_state_without_account(self, mocker):
         """Completely unparseable output still returns a valid AuthState (no exception)."""
         mocker.patch(
-            "gh_backup.auth.subprocess.run",
-            side_effect=[
-                make_completed_process(stderr="this is garbage\n", returncode=0),
-                make_completed_process(stdout="tok\n", returncode=0),
-            ],
+            "gh_backup.auth.subprocess.Popen",
+            return_value=FakePopen(stderr="this is garbage\n"),
         )
+        self._mock_token(mocker, "tok")
         state = check_auth()
         assert state.logged_in is True
         assert state.account is None
 
+    def test_terminates_gh_once_fully_parsed(self, mocker):
+        """gh is terminated early once account and scopes have been parsed."""
+        proc = FakePopen(stderr=GH_AUTH_STATUS_LOGGED_IN)
+        mocker.patch("gh_backup.auth.subprocess.Popen", return_value=proc)
+        self._mock_token(mocker)
+        check_auth()
+        assert proc.terminated is True
+
 
 # ── get_token ─────────────────────────────────────────────────────────────────
 
@@ -152,6 +180,16 @@ class TestGetToken:
         )
         assert get_token() == "ghs_abc123"
 
+    def test_passes_hostname_to_gh(self, mocker):
+        """The cache is keyed by hostname, so the command must scope to it too."""
+        mock_run = mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            return_value=make_completed_process(stdout="ghs_abc123\n"),
+        )
+        get_token("ghe.example.com")
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--hostname") + 1] == "ghe.example.com"
+
     def test_raises_runtime_error_on_called_process_error(self, mocker):
         mocker.patch(
             "gh_backup.auth.subprocess.run",
@@ -165,6 +203,29 @@ class TestGetToken:
         with pytest.raises(RuntimeError, match="not found"):
             get_token()
 
+    def test_caches_token_and_skips_repeat_subprocess(self, mocker):
+        """Second call for the same hostname returns the cached token without spawning gh."""
+        mock_run = mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            return_value=make_completed_process(stdout="ghs_abc123\n"),
+        )
+        assert get_token() == "ghs_abc123"
+        assert get_token() == "ghs_abc123"
+        assert mock_run.call_count == 1
+
+    def test_failures_are_not_cached(self, mocker):
+        """A failed token fetch is retried on the next call."""
+        mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            side_effect=[
+                subprocess.CalledProcessError(1, "gh", stderr="no credential"),
+                make_completed_process(stdout="ghs_abc123\n"),
+            ],
+        )
+        with pytest.raises(RuntimeError):
+            get_token()
+        assert get_token() == "ghs_abc123"
+
 
 # ── require_auth ──────────────────────────────────────────────────────────────
 
@@ -185,43 +246,62 @@ class TestRequireAuth:
 # ── resolve_account_type ──────────────────────────────────────────────────────
 
 
+def _graphql_owner_response(typename: str | None) -> str:
+    owner = {"__typename": typename} if typename else None
+    return json.dumps({"data": {"repositoryOwner": owner}})
+
+
 class TestResolveAccountType:
-    def test_returns_org_when_org_endpoint_succeeds(self, mocker):
+    def test_returns_org_for_organization_typename(self, mocker):
         mocker.patch(
             "gh_backup.auth.subprocess.run",
-            return_value=make_completed_process(returncode=0),
+            return_value=make_completed_process(stdout=_graphql_owner_response("Organization")),
         )
         assert resolve_account_type("myorg") == AccountType.ORG
 
-    def test_returns_user_when_org_fails_but_user_succeeds(self, mocker):
+    def test_returns_user_for_user_typename(self, mocker):
         mocker.patch(
             "gh_backup.auth.subprocess.run",
-            side_effect=[
-                subprocess.CalledProcessError(404, "gh"),
-                make_completed_process(returncode=0),
-            ],
+            return_value=make_completed_process(stdout=_graphql_owner_response("User")),
         )
         assert resolve_account_type("myuser") == AccountType.USER
 
-    def test_raises_when_both_endpoints_fail(self, mocker):
+    def test_raises_when_owner_is_null(self, mocker):
         mocker.patch(
             "gh_backup.auth.subprocess.run",
-            side_effect=subprocess.CalledProcessError(404, "gh"),
+            return_value=make_completed_process(stdout=_graphql_owner_response(None)),
         )
         with pytest.raises(RuntimeError, match="not found"):
             resolve_account_type("nonexistent")
 
-    def test_tries_org_endpoint_first(self, mocker):
-        calls = []
-
-        def side_effect(cmd, **kwargs):
-            calls.append(cmd)
-            raise subprocess.CalledProcessError(404, "gh")
+    def test_raises_on_called_process_error(self, mocker):
+        mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "gh"),
+        )
+        with pytest.raises(RuntimeError, match="not found"):
+            resolve_account_type("nonexistent")
 
-        mocker.patch("gh_backup.auth.subprocess.run", side_effect=side_effect)
-        with pytest.raises(RuntimeError):
-            resolve_account_type("name")
-        assert any("/orgs/name" in c for c in calls[0])
+    def test_makes_a_single_graphql_call(self, mocker):
+        mock_run = mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            return_value=make_completed_process(stdout=_graphql_owner_response("User")),
+        )
+        resolve_account_type("name")
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert "graphql" in cmd
+        assert any("repositoryOwner" in c for c in cmd)
+
+    def test_passes_login_as_raw_string_field(self, mocker):
+        """-f keeps an all-numeric login a string; -F would coerce it to a number."""
+        mock_run = mocker.patch(
+            "gh_backup.auth.subprocess.run",
+            return_value=make_completed_process(stdout=_graphql_owner_response("User")),
+        )
+        resolve_account_type("12345")
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("login=12345") - 1] == "-f"
 
 
 # ── warn_missing_scopes ───────────────────────────────────────────────────────
@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 
 from gh_backup.auth import AccountType, AuthState
 from gh_backup.cli import _print_summary, app
+from gh_backup.exporter import CloneType
 from gh_backup.github import ExportStats
 
 runner = CliRunner()
@@ -19,6 +20,17 @@ runner = CliRunner()
 # ── fixtures ──────────────────────────────────────────────────────────────────
 
 
+# Shared across every mock_auth_ok use — AuthState is frozen, so reusing
+# one instance is safe and skips a dataclass build per test.
+_AUTH_OK_STATE = AuthState(
+    logged_in=True,
+    account="testuser",
+    hostname="github.com",
+    token="ghs_tok",
+    scopes=["repo", "read:org"],
+)
+
+
 @pytest.fixture
 def mock_auth_ok(mocker):
     """Patch all auth calls to simulate a logged-in user.
@@ -26,13 +38,7 @@ def mock_auth_ok(mocker):
     cli.py uses `from . import auth` inside each function, so the resolved
     names are in gh_backup.auth, not gh_backup.cli.auth.
     """
-    state = AuthState(
-        logged_in=True,
-        account="testuser",
-        hostname="github.com",
-        token="ghs_tok",
-        scopes=["repo", "read:org"],
-    )
+    state = _AUTH_OK_STATE
     mocker.patch("gh_backup.auth.check_auth", return_value=state)
     mocker.patch("gh_backup.auth.require_auth", return_value=state)
     mocker.patch("gh_backup.auth.get_token", return_value="ghs_tok")
@@ -56,12 +62,6 @@ class TestMainCallback:
         assert result.exit_code == 0
         assert "gh-backup" in result.output
 
-    def test_help_shows_version_info(self):
-        """The help output includes the app version."""
-        result = runner.invoke(app, ["--help"])
-        # Version appears in the help description or body
-        assert "gh-backup" in result.output
-
 
 # ── auth subcommand ───────────────────────────────────────────────────────────
 
@@ -154,7 +154,8 @@ class TestExportCommand:
         assert "not found" in result.output
 
     def test_get_token_runtime_error_exits_one(self, mocker, tmp_path):
-        state = AuthState(True, "user", "github.com", "tok", [])
+        # token=None forces the fallback `gh auth token` call
+        state = AuthState(True, "user", "github.com", None, [])
         mocker.patch("gh_backup.auth.require_auth", return_value=state)
         mocker.patch(
             "gh_backup.auth.get_token",
@@ -276,13 +277,40 @@ class TestExportCommand:
         runner.invoke(app, ["export", "myorg", "--output", str(tmp_path), "--keep-dir"])
         assert captured["config"].keep_dir is True
 
+    def test_clone_type_option_sets_config(self, mocker, mock_auth_ok, tmp_path):
+        captured = {}
+
+        def capture(config, console):
+            captured["config"] = config
+            return ExportStats(repos_total=0)
+
+        mocker.patch("gh_backup.cli.run_export", side_effect=capture)
+        runner.invoke(
+            app,
+            ["export", "myorg", "--output", str(tmp_path), "--clone-type", "blobless"],
+        )
+        assert captured["config"].clone_type == CloneType.BLOBLESS
+
+    def test_shallow_flag_maps_to_shallow_clone_type(self, mocker, mock_auth_ok, tmp_path):
+        captured = {}
+
+        def capture(config, console):
+            captured["config"] = config
+            return ExportStats(repos_total=0)
+
+        mocker.patch("gh_backup.cli.run_export", side_effect=capture)
+        runner.invoke(app, ["export", "myorg", "--output", str(tmp_path), "--shallow"])
+        assert captured["config"].clone_type == CloneType.SHALLOW
+
 
 # ── _print_summary ────────────────────────────────────────────────────────────
 
 
 def _buf_console() -> tuple[StringIO, Console]:
+    # force_terminal=False plus a fixed width keeps Console() from probing
+    # the environment and terminal size on every construction.
     buf = StringIO()
-    return buf, Console(file=buf, highlight=False)
+    return buf, Console(file=buf, highlight=False, force_terminal=False, width=80)
 
 
 class TestPrintSummary:
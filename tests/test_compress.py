@@ -8,6 +8,7 @@ import pytest
 
 from gh_backup.compress import (
     ArchiveFormat,
+    _iter_entries,
     compress_directory,
     get_archive_suffix,
     verify_archive,
@@ -29,6 +30,29 @@ class TestGetArchiveSuffix:
         assert get_archive_suffix(fmt) == expected
 
 
+# ── _iter_entries ─────────────────────────────────────────────────────────────
+
+
+class TestIterEntries:
+    def test_yields_all_files_with_sizes(self, source_dir):
+        entries = {arcname: size for _, arcname, size in _iter_entries(source_dir)}
+        assert entries["source/file1.txt"] == len("hello")
+        assert entries["source/sub/file2.txt"] == len("world")
+
+    def test_empty_directory_yielded_with_none_size(self, source_dir):
+        entries = {arcname: size for _, arcname, size in _iter_entries(source_dir)}
+        assert entries["source/empty_dir"] is None
+
+    def test_arcnames_are_relative_to_source_parent(self, source_dir):
+        arcnames = [arcname for _, arcname, _ in _iter_entries(source_dir)]
+        assert all(arcname.startswith("source") for arcname in arcnames)
+
+    def test_empty_source_dir_yields_nothing(self, tmp_path):
+        src = tmp_path / "empty_src"
+        src.mkdir()
+        assert list(_iter_entries(src)) == []
+
+
 # ── compress_directory ────────────────────────────────────────────────────────
 
 
@@ -78,6 +102,18 @@ class TestCompressDirectory:
         assert len(calls) > 0
         assert all(calls[i] <= calls[i + 1] for i in range(len(calls) - 1))
 
+    def test_progress_callback_reports_final_total(self, source_dir, tmp_path):
+        """The last callback always carries the full byte total, even below the
+        reporting interval."""
+        calls = []
+        compress_directory(
+            source_dir=source_dir,
+            output_path=tmp_path / "out.tar.zst",
+            progress_callback=calls.append,
+        )
+        total = sum(f.stat().st_size for f in source_dir.rglob("*") if f.is_file())
+        assert calls[-1] == total
+
     def test_none_progress_callback_does_not_raise(self, source_dir, tmp_path):
         compress_directory(
             source_dir=source_dir,
@@ -102,21 +138,14 @@ class TestCompressZst:
             with dctx.stream_reader(f) as reader:
                 # Use streaming mode "r|" because the zstd reader is non-seekable
                 with tarfile.open(fileobj=reader, mode="r|") as tar:
-                    names = [m.name for m in tar]
+                    basenames = {m.name.rsplit("/", 1)[-1] for m in tar}
 
-        assert any("file1.txt" in n for n in names)
-        assert any("file2.txt" in n for n in names)
+        assert {"file1.txt", "file2.txt"} <= basenames
 
     @pytest.mark.parametrize("level", [1, 3, 9])
-    def test_various_compression_levels_produce_valid_archive(self, source_dir, tmp_path, level):
-        output = tmp_path / f"out-level{level}.tar.zst"
-        compress_directory(
-            source_dir=source_dir,
-            output_path=output,
-            fmt=ArchiveFormat.ZST,
-            level=level,
-        )
-        assert output.exists()
+    def test_various_compression_levels_produce_valid_archive(self, prebuilt_archives, level):
+        output = prebuilt_archives[(ArchiveFormat.ZST, level)]
+        # A successful stat implies existence — one syscall covers both checks.
         assert output.stat().st_size > 0
 
 
@@ -127,10 +156,11 @@ class TestCompressGz:
     def test_archive_contains_source_files(self, source_dir, tmp_path):
         output = tmp_path / "out.tar.gz"
         compress_directory(source_dir=source_dir, output_path=output, fmt=ArchiveFormat.GZ)
-        with tarfile.open(str(output), "r:gz") as tar:
-            names = tar.getnames()
-        assert any("file1.txt" in n for n in names)
-        assert any("file2.txt" in n for n in names)
+        # Streaming mode scans members without materializing the full index;
+        # the basename set turns the two substring scans into O(1) lookups.
+        with tarfile.open(str(output), "r|gz") as tar:
+            basenames = {m.name.rsplit("/", 1)[-1] for m in tar}
+        assert {"file1.txt", "file2.txt"} <= basenames
 
     def test_produces_non_empty_archive(self, source_dir, tmp_path):
         output = tmp_path / "out.tar.gz"
@@ -145,9 +175,9 @@ class TestCompressXz:
     def test_archive_contains_source_files(self, source_dir, tmp_path):
         output = tmp_path / "out.tar.xz"
         compress_directory(source_dir=source_dir, output_path=output, fmt=ArchiveFormat.XZ)
-        with tarfile.open(str(output), "r:xz") as tar:
-            names = tar.getnames()
-        assert any("file1.txt" in n for n in names)
+        with tarfile.open(str(output), "r|xz") as tar:
+            found = any("file1.txt" in m.name for m in tar)
+        assert found
 
     def test_produces_non_empty_archive(self, source_dir, tmp_path):
         output = tmp_path / "out.tar.xz"
@@ -164,11 +194,8 @@ class TestVerifyArchive:
             verify_archive(tmp_path / "nonexistent.tar.zst")
 
     @pytest.mark.parametrize("fmt", [ArchiveFormat.ZST, ArchiveFormat.GZ, ArchiveFormat.XZ])
-    def test_returns_positive_member_count_for_valid_archive(self, source_dir, tmp_path, fmt):
-        suffix = get_archive_suffix(fmt)
-        output = tmp_path / f"out{suffix}"
-        compress_directory(source_dir=source_dir, output_path=output, fmt=fmt)
-        count = verify_archive(output)
+    def test_returns_positive_member_count_for_valid_archive(self, prebuilt_archives, fmt):
+        count = verify_archive(prebuilt_archives[(fmt, 3)])
         assert count > 0
 
 
@@ -185,8 +212,32 @@ class TestCompressEdgeCases:
         assert output.exists()
 
     @pytest.mark.parametrize("fmt", [ArchiveFormat.ZST, ArchiveFormat.GZ, ArchiveFormat.XZ])
-    def test_all_formats_produce_non_empty_archive(self, source_dir, tmp_path, fmt):
-        suffix = get_archive_suffix(fmt)
-        output = tmp_path / f"out{suffix}"
-        compress_directory(source_dir=source_dir, output_path=output, fmt=fmt)
-        assert output.stat().st_size > 0
+    def test_all_formats_produce_non_empty_archive(self, prebuilt_archives, fmt):
+        assert prebuilt_archives[(fmt, 3)].stat().st_size > 0
+
+    def test_symlinks_are_archived_as_links(self, tmp_path):
+        """File, directory, and dangling symlinks become SYMTYPE members,
+        never read-ahead payloads (a dir/dangling target would blow up open())."""
+        import zstandard
+
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "file.txt").write_text("data")
+        (src / "link-to-file").symlink_to(src / "file.txt")
+        (src / "link-to-dir").symlink_to(src / "sub")
+        (src / "dangling").symlink_to(src / "missing")
+        output = tmp_path / "out.tar.zst"
+        compress_directory(source_dir=src, output_path=output)
+
+        dctx = zstandard.ZstdDecompressor()
+        with open(output, "rb") as f, dctx.stream_reader(f) as reader:
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                links = {m.name.rsplit("/", 1)[-1] for m in tar if m.issym()}
+        assert {"link-to-file", "link-to-dir", "dangling"} <= links
+
+    def test_empty_dirs_preserved_in_stdlib_formats(self, source_dir, tmp_path):
+        output = tmp_path / "out.tar.gz"
+        compress_directory(source_dir=source_dir, output_path=output, fmt=ArchiveFormat.GZ)
+        with tarfile.open(str(output), "r|gz") as tar:
+            dirs = {m.name.rsplit("/", 1)[-1] for m in tar if m.isdir()}
+        assert "empty_dir" in dirs
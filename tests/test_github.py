@@ -13,11 +13,18 @@ from gh_backup.github import (
     _parse_paginated_json,
     _run_gh,
     fetch_issues,
+    fetch_issues_and_pulls_graphql,
     fetch_pulls,
+    iter_issues_and_pulls_graphql,
     list_repos,
 )
 from tests.conftest import REPO_LIST_JSON, make_completed_process
 
+# Fixed payloads shared read-only across tests — build each CompletedProcess
+# once at import instead of once per mock setup.
+_REPO_LIST_PROC = make_completed_process(stdout=REPO_LIST_JSON)
+_EMPTY_LIST_PROC = make_completed_process(stdout="[]")
+
 # ── _run_gh ───────────────────────────────────────────────────────────────────
 
 
@@ -82,6 +89,16 @@ class TestParsePaginatedJson:
         result = _parse_paginated_json(f"{page1}\n{{bad json}}")
         assert len(result) == 1
 
+    def test_accepts_bytes_single_array(self):
+        data = [{"id": 1}, {"id": 2}]
+        assert _parse_paginated_json(json.dumps(data).encode()) == data
+
+    def test_accepts_bytes_concatenated_arrays(self):
+        page1 = json.dumps([{"id": 1}]).encode()
+        page2 = json.dumps([{"id": 2}]).encode()
+        result = _parse_paginated_json(page1 + b"\n" + page2)
+        assert len(result) == 2
+
     def test_empty_array_returns_empty_list(self):
         assert _parse_paginated_json("[]") == []
 
@@ -110,7 +127,7 @@ class TestListRepos:
     def test_returns_repo_info_objects(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg")
         assert len(repos) == 2
@@ -119,7 +136,7 @@ class TestListRepos:
     def test_maps_all_fields_correctly(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg")
         r = repos[0]
@@ -133,7 +150,7 @@ class TestListRepos:
     def test_null_description_becomes_empty_string(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg")
         assert repos[1].description == ""
@@ -141,7 +158,7 @@ class TestListRepos:
     def test_null_default_branch_ref_becomes_none(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg")
         assert repos[1].default_branch is None
@@ -149,7 +166,7 @@ class TestListRepos:
     def test_null_disk_usage_becomes_zero(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg")
         assert repos[1].disk_usage_kb == 0
@@ -157,7 +174,7 @@ class TestListRepos:
     def test_only_filter_keeps_matching_repos(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         repos = list_repos("myorg", only=["repo-a"])
         assert len(repos) == 1
@@ -166,14 +183,14 @@ class TestListRepos:
     def test_only_filter_returns_empty_for_unknown_name(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=REPO_LIST_JSON),
+            return_value=_REPO_LIST_PROC,
         )
         assert list_repos("myorg", only=["does-not-exist"]) == []
 
     def test_passes_json_and_limit_args(self, mocker):
         mock_run = mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=_EMPTY_LIST_PROC,
         )
         list_repos("someorg")
         call_args = mock_run.call_args[0]
@@ -183,7 +200,7 @@ class TestListRepos:
     def test_empty_json_returns_empty_list(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=_EMPTY_LIST_PROC,
         )
         assert list_repos("emptyorg") == []
 
@@ -196,88 +213,182 @@ class TestListRepos:
             list_repos("badorg")
 
 
-# ── fetch_issues ──────────────────────────────────────────────────────────────
+# ── fetch_issues / fetch_pulls ────────────────────────────────────────────────
 
 
-class TestFetchIssues:
-    def test_returns_list_of_dicts(self, mocker):
+# The two REST fetchers differ only in endpoint, so one parametrized class
+# covers both and a future endpoint is a one-line addition.
+@pytest.mark.parametrize(
+    "fetch,endpoint",
+    [
+        (fetch_issues, "/repos/myorg/my-repo/issues"),
+        (fetch_pulls, "/repos/myorg/my-repo/pulls"),
+    ],
+    ids=["issues", "pulls"],
+)
+class TestFetchPaginated:
+    def test_returns_list_of_dicts(self, mocker, fetch, endpoint):
         data = [{"id": 1, "title": "Bug"}, {"id": 2, "title": "Feature"}]
         mocker.patch(
             "gh_backup.github._run_gh",
             return_value=make_completed_process(stdout=json.dumps(data)),
         )
-        assert fetch_issues("myorg", "my-repo") == data
+        assert fetch("myorg", "my-repo") == data
 
-    def test_calls_correct_endpoint(self, mocker):
+    def test_calls_correct_endpoint(self, mocker, fetch, endpoint):
         mock_run = mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=_EMPTY_LIST_PROC,
         )
-        fetch_issues("myorg", "my-repo")
-        args = mock_run.call_args[0]
-        assert "/repos/myorg/my-repo/issues" in args
+        fetch("myorg", "my-repo")
+        assert endpoint in mock_run.call_args[0]
 
-    def test_passes_paginate_flag(self, mocker):
+    def test_passes_paginate_flag(self, mocker, fetch, endpoint):
         mock_run = mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=_EMPTY_LIST_PROC,
         )
-        fetch_issues("myorg", "my-repo")
+        fetch("myorg", "my-repo")
         assert "--paginate" in mock_run.call_args[0]
 
-    def test_empty_response_returns_empty_list(self, mocker):
+    def test_empty_response_returns_empty_list(self, mocker, fetch, endpoint):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=_EMPTY_LIST_PROC,
         )
-        assert fetch_issues("myorg", "my-repo") == []
+        assert fetch("myorg", "my-repo") == []
 
-    def test_handles_two_page_concatenated_output(self, mocker):
+    def test_handles_two_page_concatenated_output(self, mocker, fetch, endpoint):
         page1 = json.dumps([{"id": 1}])
         page2 = json.dumps([{"id": 2}])
         mocker.patch(
             "gh_backup.github._run_gh",
             return_value=make_completed_process(stdout=f"{page1}\n{page2}"),
         )
-        result = fetch_issues("myorg", "my-repo")
+        result = fetch("myorg", "my-repo")
         assert len(result) == 2
 
 
-# ── fetch_pulls ───────────────────────────────────────────────────────────────
+# ── fetch_issues_and_pulls_graphql ────────────────────────────────────────────
+
+
+def _graphql_page(
+    issues: list[dict] | None = None,
+    pulls: list[dict] | None = None,
+    issues_next: str | None = None,
+    pulls_next: str | None = None,
+) -> str:
+    """Build a GraphQL response page; a None connection is omitted (@include)."""
+    repository: dict = {}
+    if issues is not None:
+        repository["issues"] = {
+            "pageInfo": {"hasNextPage": issues_next is not None, "endCursor": issues_next},
+            "nodes": issues,
+        }
+    if pulls is not None:
+        repository["pullRequests"] = {
+            "pageInfo": {"hasNextPage": pulls_next is not None, "endCursor": pulls_next},
+            "nodes": pulls,
+        }
+    return json.dumps({"data": {"repository": repository}})
+
+
+class TestFetchIssuesAndPullsGraphql:
+    def test_returns_issues_and_pulls_from_single_page(self, mocker):
+        mocker.patch(
+            "gh_backup.github._run_gh",
+            return_value=make_completed_process(
+                stdout=_graphql_page(issues=[{"number": 1}], pulls=[{"number": 2}])
+            ),
+        )
+        issues, pulls = fetch_issues_and_pulls_graphql("myorg", "my-repo")
+        assert issues == [{"number": 1}]
+        assert pulls == [{"number": 2}]
 
+    def test_paginates_until_both_connections_exhausted(self, mocker):
+        """Issues need two pages; PRs finish on the first; nodes are merged."""
+        mock_run = mocker.patch(
+            "gh_backup.github._run_gh",
+            side_effect=[
+                make_completed_process(
+                    stdout=_graphql_page(
+                        issues=[{"number": 1}], pulls=[{"number": 10}], issues_next="cursor1"
+                    )
+                ),
+                make_completed_process(stdout=_graphql_page(issues=[{"number": 2}])),
+            ],
+        )
+        issues, pulls = fetch_issues_and_pulls_graphql("myorg", "my-repo")
+        assert issues == [{"number": 1}, {"number": 2}]
+        assert pulls == [{"number": 10}]
+        assert mock_run.call_count == 2
+        # Second page resumes from the issues cursor and skips the PR connection.
+        second_args = mock_run.call_args_list[1][0]
+        assert "issuesCursor=cursor1" in second_args
+        assert "fetchPulls=false" in second_args
+
+    def test_raises_runtime_error_on_graphql_errors(self, mocker):
+        mocker.patch(
+            "gh_backup.github._run_gh",
+            return_value=make_completed_process(
+                stdout=json.dumps({"data": None, "errors": [{"message": "boom"}]})
+            ),
+        )
+        with pytest.raises(RuntimeError, match="GraphQL errors"):
+            fetch_issues_and_pulls_graphql("myorg", "my-repo")
 
-class TestFetchPulls:
-    def test_returns_list_of_dicts(self, mocker):
-        data = [{"id": 10, "title": "PR 1"}]
+    def test_raises_runtime_error_when_repository_null(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout=json.dumps(data)),
+            return_value=make_completed_process(stdout=json.dumps({"data": {"repository": None}})),
         )
-        assert fetch_pulls("myorg", "my-repo") == data
+        with pytest.raises(RuntimeError, match="no repository"):
+            fetch_issues_and_pulls_graphql("myorg", "my-repo")
 
-    def test_calls_correct_endpoint(self, mocker):
+    def test_query_requests_pages_of_100(self, mocker):
         mock_run = mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            return_value=make_completed_process(stdout=_graphql_page(issues=[], pulls=[])),
         )
-        fetch_pulls("myorg", "my-repo")
-        args = mock_run.call_args[0]
-        assert "/repos/myorg/my-repo/pulls" in args
+        fetch_issues_and_pulls_graphql("myorg", "my-repo")
+        query_arg = next(a for a in mock_run.call_args[0] if a.startswith("query="))
+        assert "first: 100" in query_arg
 
-    def test_passes_paginate_flag(self, mocker):
-        mock_run = mocker.patch(
+    def test_propagates_called_process_error(self, mocker):
+        mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            side_effect=subprocess.CalledProcessError(1, "gh"),
         )
-        fetch_pulls("myorg", "my-repo")
-        assert "--paginate" in mock_run.call_args[0]
+        with pytest.raises(subprocess.CalledProcessError):
+            fetch_issues_and_pulls_graphql("myorg", "my-repo")
+
+    def test_raises_when_labels_exceed_query_cap(self, mocker):
+        """A node with >100 labels must trigger the REST fallback, not truncate."""
+        node = {"number": 7, "labels": {"pageInfo": {"hasNextPage": True}, "nodes": []}}
+        mocker.patch(
+            "gh_backup.github._run_gh",
+            return_value=make_completed_process(stdout=_graphql_page(issues=[node], pulls=[])),
+        )
+        with pytest.raises(RuntimeError, match="labels"):
+            fetch_issues_and_pulls_graphql("myorg", "my-repo")
 
-    def test_empty_response_returns_empty_list(self, mocker):
+    def test_iter_variant_yields_one_tuple_per_page(self, mocker):
         mocker.patch(
             "gh_backup.github._run_gh",
-            return_value=make_completed_process(stdout="[]"),
+            side_effect=[
+                make_completed_process(
+                    stdout=_graphql_page(
+                        issues=[{"number": 1}], pulls=[{"number": 10}], issues_next="cursor1"
+                    )
+                ),
+                make_completed_process(stdout=_graphql_page(issues=[{"number": 2}])),
+            ],
         )
-        assert fetch_pulls("myorg", "my-repo") == []
+        pages = list(iter_issues_and_pulls_graphql("myorg", "my-repo"))
+        assert pages == [
+            ([{"number": 1}], [{"number": 10}]),
+            ([{"number": 2}], []),
+        ]
 
 
 # ── RepoInfo dataclass ────────────────────────────────────────────────────────